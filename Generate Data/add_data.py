@@ -1,6 +1,11 @@
 # add_data.py
+import sys
 
 def get_user_data():
+    # Piped input is read in one go instead of one input() round trip per line
+    if not sys.stdin.isatty():
+        return get_user_data_batch(sys.stdin.read().splitlines())
+
     data_list = []
 
     while True:
@@ -11,6 +16,16 @@ def get_user_data():
 
     return data_list
 
+def get_user_data_batch(lines):
+    data_list = []
+
+    for line in lines:
+        if line.lower() == 'done':
+            break
+        data_list.append(line)
+
+    return data_list
+
 if __name__ == "__main__":
     data = get_user_data()
     print("Data input complete.")
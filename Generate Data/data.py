@@ -1,36 +1,84 @@
+import os
 import pandas as pd
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tkinter import filedialog
-import matplotlib.pyplot as plt
+
+# Only this many rows are ever rendered, so there is no point parsing the rest
+MAX_DISPLAY_ROWS = 1000
+
+# CSV parsing runs here so the Tk event loop stays responsive
+_executor = ThreadPoolExecutor(max_workers=1)
+
+# The table window is built once and redrawn in place on every load
+_table_view = {}
+
+@lru_cache(maxsize=8)
+def _read_csv_cached(filename, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key, so an edited file is parsed again
+    return pd.read_csv(filename, nrows=MAX_DISPLAY_ROWS)
 
 def read_csv_file(filename):
     try:
-        data = pd.read_csv(filename)
-        return data
+        stat = os.stat(filename)
     except FileNotFoundError as exception:
         print(f"Error: {exception}")
         return None
+    return _read_csv_cached(filename, stat.st_mtime_ns, stat.st_size)
+
+def _get_table_axes(root):
+    window = _table_view.get('window')
+    if window is None or not window.winfo_exists():
+        # matplotlib is only imported once there is something to show
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        window = tk.Toplevel(root)
+        window.title("CSV Data")
+        figure = Figure(figsize=(10, 6))
+        canvas = FigureCanvasTkAgg(figure, master=window)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        _table_view.update(window=window, axes=figure.add_subplot(111), canvas=canvas)
+    window.lift()
+    return _table_view['axes'], _table_view['canvas']
 
-def display_data(data):
+def display_data(data, root):
     if data is not None:
         print(data)
+        # Convert every cell to text in one vectorized pass rather than per cell
+        cell_text = data.fillna('').astype(str).to_numpy().tolist()
         # Use matplotlib to display data in a text-based format
-        plt.table(cellText=data.values, colLabels=data.columns, cellLoc='center', loc='center')
-        plt.axis('off')
-        plt.show()
+        axes, canvas = _get_table_axes(root)
+        axes.clear()
+        axes.table(cellText=cell_text, colLabels=data.columns, cellLoc='center', loc='center')
+        axes.axis('off')
+        canvas.draw_idle()
     else:
         print("No data to display.")
 
+def load_csv_in_background(root, filename):
+    """
+    Parse the CSV on the worker thread and display it once the parse is done.
+    """
+    future = _executor.submit(read_csv_file, filename)
+
+    def poll():
+        if future.done():
+            display_data(future.result(), root)
+        else:
+            root.after(30, poll)
+
+    root.after(30, poll)
+
 def on_drop(event):
     filename = event.data
-    data = read_csv_file(filename)
-    display_data(data)
+    load_csv_in_background(event.widget, filename)
 
-def choose_csv_file():
+def choose_csv_file(root):
     file_path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
     if file_path:
-        data = read_csv_file(file_path)
-        display_data(data)
+        load_csv_in_background(root, file_path)
 
 def main():
     """
@@ -43,7 +91,7 @@ def main():
         label = tk.Label(root, text="Select a CSV file:")
         label.pack(pady=10)
 
-        choose_button = tk.Button(root, text="Choose CSV File", command=choose_csv_file)
+        choose_button = tk.Button(root, text="Choose CSV File", command=lambda: choose_csv_file(root))
         choose_button.pack(pady=5)
 
         root.drop_target_register('<<Drop>>')
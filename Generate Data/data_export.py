@@ -1,29 +1,124 @@
 import csv
 import json
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import math
+from datetime import date, time
+from xml.sax.saxutils import escape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Large output buffer so big exports make few write() syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Characters in column names that are not allowed in XML tag names
+_XML_TAG_TRANS = str.maketrans({' ': '_', '-': '_'})
+
+def _replace_non_finite(value):
+    # orjson writes NaN and infinity as null; do the same so the stdlib output is valid JSON too
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+def _json_default(value):
+    # Match what orjson writes natively for the types the stdlib encoder doesn't know
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if hasattr(value, 'tolist'):  # numpy scalars and arrays
+        return _replace_non_finite(value.tolist())
+    return str(value)
+
+def _json_dumps(value, indent=False):
+    """
+    Serialize to UTF-8 JSON bytes with orjson when available, otherwise with the stdlib encoder.
+    Both produce the same values; only the spelling of some floats differs (1e16 vs 1e+16).
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, default=str, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits, which only the stdlib encoder can write
+    value = _replace_non_finite(value)
+    if indent:
+        text = json.dumps(value, indent=2, ensure_ascii=False, allow_nan=False, default=_json_default)
+    else:
+        text = json.dumps(value, separators=(',', ':'), ensure_ascii=False, allow_nan=False, default=_json_default)
+    return text.encode('utf-8')
 
 def export_to_csv(data_list, filename):
-    with open(filename, 'w', newline='') as csvfile:
+    with open(filename, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
+        fieldnames = list(dict.fromkeys(key for item in data_list for key in item))  # Union of all keys, in first-seen order
         writer = csv.writer(csvfile)
-        writer.writerow(data_list[0].keys())  # Write the header row using the keys of the dictionary (column names)
-        for item in data_list:
-            writer.writerow(item.values())  # Write the data rows using the values of the dictionary
+        writer.writerow(fieldnames)
+        writer.writerows([item.get(key, '') for key in fieldnames] for item in data_list)  # Write all data rows in a single call
 
 def export_to_json(data_list, filename):
-    with open(filename, 'w') as jsonfile:
-        json.dump(data_list, jsonfile, indent=2)
+    with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as jsonfile:
+        jsonfile.write(_json_dumps(data_list, indent=True))
+
+def export_to_jsonl(data_list, filename):
+    # One object per line, so each row is serialized and written on its own
+    with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as jsonfile:
+        for row in data_list:
+            jsonfile.write(_json_dumps(row) + b"\n")
 
 def export_to_xml(data_list, filename):
-    root = ET.Element("data")
-    for row in data_list:
-        data_element = ET.SubElement(root, "item")
-        for key, value in row.items():
-            column_element = ET.SubElement(data_element, key)
-            column_element.text = value
+    # Write each row out as it is produced instead of building the whole tree in memory
+    with open(filename, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as xmlfile:
+        tags = {}  # Column name -> (open tag, close tag), so each name is only sanitized once
+        xmlfile.write("<data>")
+        for row in data_list:
+            parts = ["<item>"]
+            for key, value in row.items():
+                tag = tags.get(key)
+                if tag is None:
+                    clean_key = key.translate(_XML_TAG_TRANS)
+                    tag = tags[key] = (f"<{clean_key}>", f"</{clean_key}>")
+                # Values typed at the prompt are already str; only convert anything else
+                text = value if isinstance(value, str) else ("" if value is None else str(value))
+                parts += (tag[0], escape(text), tag[1])
+            parts.append("</item>")
+            xmlfile.write("".join(parts))  # One write per row
+        xmlfile.write("</data>")
+
+def export_to_parquet(data_list, filename, compression='zstd', row_group_size=50_000):
+    # pyarrow is only needed for this format, so the other exports don't pay for importing it
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    chunks = [data_list[start:start + row_group_size] for start in range(0, len(data_list), row_group_size)]
+
+    def chunk_schema(chunk):
+        # Rows can have different keys, so use the union of the chunk's keys, in first-seen order
+        fieldnames = dict.fromkeys(key for item in chunk for key in item)
+        return pa.Table.from_pydict({key: [item.get(key) for item in chunk] for key in fieldnames}).schema
 
-    tree = ET.ElementTree(root)
-    tree.write(filename)
+    # Infer types one chunk at a time and unify them (a column that is all None in one chunk
+    # takes its type from the others), so only one chunk is ever held as Arrow data.
+    # The cost is that every cell is converted twice: once here and once when it is written.
+    schema = pa.unify_schemas([chunk_schema(chunk) for chunk in chunks]) if chunks else pa.schema([])
+    writer = pq.ParquetWriter(filename, schema, compression=compression, compression_level=3 if compression == 'zstd' else None)
+    try:
+        for chunk in chunks:
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+    finally:
+        writer.close()
+
+# Export format -> function; the CLI writes to data.<format>
+EXPORTERS = {
+    'csv': export_to_csv,
+    'json': export_to_json,
+    'jsonl': export_to_jsonl,
+    'xml': export_to_xml,
+    'parquet': export_to_parquet,
+}
 
 if __name__ == "__main__":
     data = []
@@ -42,13 +137,15 @@ if __name__ == "__main__":
     if not data:
         print("No data entered. Exiting.")
     else:
-        export_choice = input("Enter the format to export (csv, json, xml): ").lower()
-        if export_choice == 'csv':
-            export_to_csv(data, "data.csv")
-        elif export_choice == 'json':
-            export_to_json(data, "data.json")
-        elif export_choice == 'xml':
-            export_to_xml(data, "data.xml")
-        else:
+        export_choice = input(f"Enter the format to export ({', '.join(EXPORTERS)}): ").lower()
+        exporter = EXPORTERS.get(export_choice)
+        if exporter is None:
             print("Invalid export format. Data not exported.")
-        print("Data exported successfully.")
\ No newline at end of file
+        else:
+            try:
+                exporter(data, f"data.{export_choice}")
+            except ImportError as exception:
+                # Only the optional formats (parquet needs pyarrow) can get here
+                print(f"Error: {exception}. Install it to export {export_choice}, or choose another format.")
+            else:
+                print("Data exported successfully.")
\ No newline at end of file
@@ -0,0 +1,80 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+import data_export
+
+
+def test_export_to_parquet_keeps_columns_from_later_rows(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [{'a': '1'}, {'a': '2'}, {'a': '3'}, {'a': '4', 'b': 'y'}]
+    filename = tmp_path / "data.parquet"
+
+    # 'b' first appears in the last row, which lands in the second row group
+    data_export.export_to_parquet(rows, filename, row_group_size=2)
+
+    parquet_file = pq.ParquetFile(filename)
+    assert parquet_file.metadata.num_row_groups == 2
+    assert parquet_file.read().to_pylist() == [
+        {'a': '1', 'b': None},
+        {'a': '2', 'b': None},
+        {'a': '3', 'b': None},
+        {'a': '4', 'b': 'y'},
+    ]
+
+
+def test_export_to_parquet_takes_column_type_from_later_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    rows = [{'a': None}, {'a': None}, {'a': 3}]
+    filename = tmp_path / "data.parquet"
+
+    # 'a' is all None in the first row group, so its type comes from the second one
+    data_export.export_to_parquet(rows, filename, row_group_size=2)
+
+    table = pq.read_table(filename)
+    assert str(table.schema.field('a').type) == 'int64'
+    assert table.to_pylist() == rows
+
+
+def _load_strict(text):
+    def reject(constant):
+        raise ValueError(f"invalid JSON constant {constant}")
+    return json.loads(text, parse_constant=reject)
+
+
+def _load_strict_lines(text):
+    return [_load_strict(line) for line in text.splitlines()]
+
+
+@pytest.mark.parametrize("export, load", [
+    (data_export.export_to_json, _load_strict),
+    (data_export.export_to_jsonl, _load_strict_lines),
+])
+def test_json_exports_agree_with_and_without_orjson(export, load, tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    rows = [
+        {'a': 'é', 1: datetime(2020, 1, 1), 'b': Decimal('1.5')},
+        {'a': None, 'c': [1, 2], 'nan': float('nan'), 'inf': float('-inf'), 'big': 1e16},
+    ]
+
+    export(rows, tmp_path / "fast")
+    monkeypatch.setattr(data_export, "orjson", None)
+    export(rows, tmp_path / "stdlib")
+
+    fast = load((tmp_path / "fast").read_text(encoding='utf-8'))
+    assert fast == load((tmp_path / "stdlib").read_text(encoding='utf-8'))
+    assert fast[1]['nan'] is None and fast[1]['inf'] is None
+
+
+@pytest.mark.parametrize("export, load", [
+    (data_export.export_to_json, _load_strict),
+    (data_export.export_to_jsonl, _load_strict_lines),
+])
+def test_json_exports_write_integers_beyond_64_bits(export, load, tmp_path):
+    rows = [{'a': 2 ** 70}, {'a': 1}]
+
+    export(rows, tmp_path / "out")
+
+    assert load((tmp_path / "out").read_text(encoding='utf-8')) == rows
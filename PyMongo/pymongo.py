@@ -1,29 +1,106 @@
 import pymongo
-from pymongo import MongoClient
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pymongo import MongoClient, WriteConcern
+from pymongo.errors import BulkWriteError
 import pandas as pd
 import tkinter as tk
 from tkinter import filedialog
 
+def _df_to_records(df):
+    # Pull each column out as one object array and zip the rows together, which is
+    # much cheaper than df.to_dict('records') boxing every cell individually
+    columns = list(df.columns)
+    arrays = [df[column].to_numpy(dtype=object, na_value=None) for column in columns]
+    dict_, zip_ = dict, zip
+    return [dict_(zip_(columns, row)) for row in zip_(*arrays)]
+
 class MongoDB(object):
-    def __init__(self, host=None, port=None):
+    # One MongoClient per (host, port), so repeated imports reuse its connection pool
+    _clients = {}
+
+    def __init__(self, host=None, port=None, fast_insert=False):
         self.host = host
         self.port = port
+        self.fast_insert = fast_insert
 
     def create_connection(self, dbName, collectionName):
-        connection_string = f"mongodb://{self.host}:{self.port}/{dbName}"
-        self.client = MongoClient(connection_string)
+        self.client = self._get_client(self.host, self.port)
         self.DB = self.client[dbName]
-        self.collection = self.DB[collectionName]
+        # w=0 skips the acknowledgement round trip for every batch, but write errors are no longer reported
+        write_concern = WriteConcern(w=0) if self.fast_insert else None
+        self.collection = self.DB.get_collection(collectionName, write_concern=write_concern)
 
-    def InsertData(self, path=None):
+    @classmethod
+    def _get_client(cls, host, port):
+        client = cls._clients.get((host, port))
+        if client is None:
+            # No database in the URI: the client is shared by imports into every database on this server
+            connection_string = f"mongodb://{host}:{port}/"
+            # No ping or listCollections here: a bad host surfaces on the first insert, within the timeout.
+            # Wire compression shrinks the repetitive CSV payloads; codecs whose package is missing are skipped.
+            client = cls._clients[(host, port)] = MongoClient(
+                connection_string,
+                serverSelectionTimeoutMS=5000,
+                compressors='zstd,snappy,zlib',
+                zlibCompressionLevel=3,
+            )
+        return client
+
+    def _insert_batch(self, documents):
+        # A failed document only fails its own row; the rest of the batch is still inserted
         try:
-            df = pd.read_csv(path)
-            data = df.to_dict('records')
+            result = self.collection.insert_many(documents, ordered=False)
+            return len(result.inserted_ids), 0
+        except BulkWriteError as e:
+            return e.details['nInserted'], len(e.details['writeErrors'])
+
+    def InsertData(self, path=None, batch_size=1000, concurrency=4):
+        inserted_count = error_count = 0
+        failure = None
 
-            self.collection.insert_many(data, ordered=False)
-            print("All the data has been exported to the MongoDB server... ")
+        def collect(futures):
+            # Count every finished batch on its own, so one batch failing outright doesn't lose the others
+            nonlocal inserted_count, error_count, failure
+            for future in futures:
+                try:
+                    inserted, errors = future.result()
+                except Exception as e:
+                    failure = failure or e
+                else:
+                    inserted_count += inserted
+                    error_count += errors
+
+        try:
+            # Read and insert one chunk at a time so memory stays bounded by batch_size rows.
+            # Up to `concurrency` batches are in flight at once so their round trips overlap.
+            pending = set()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor, pd.read_csv(path, chunksize=batch_size) as reader:
+                submit, insert_batch = executor.submit, self._insert_batch
+                try:
+                    for chunk in reader:
+                        if len(pending) >= concurrency:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            collect(done)
+                            if failure is not None:
+                                break
+                        pending.add(submit(insert_batch, _df_to_records(chunk)))
+                finally:
+                    # Batches already sent are written even if reading the CSV fails, so count them too
+                    collect(pending)
+            if failure is not None:
+                raise failure
+            if self.fast_insert:
+                # With w=0 the server acknowledges nothing, so only the number of documents sent is known
+                print(f"All the data has been sent to the MongoDB server... ({inserted_count} documents sent (unacknowledged))")
+            else:
+                print(f"All the data has been exported to the MongoDB server... ({inserted_count} documents inserted, {error_count} failed)")
         except Exception as e:
             print("An error occurred during data insertion:", e)
+            if self.fast_insert:
+                print(f"{inserted_count} documents were sent (unacknowledged) before the import stopped.")
+            else:
+                print(f"{inserted_count} documents were inserted and {error_count} failed before the import stopped.")
 
 def select_csv_file():
     file_path = filedialog.askopenfilename(title="Select a CSV file")
@@ -39,9 +116,10 @@ def import_to_mongodb():
     csv_file_path = csv_entry.get()
     
     if host and port and dbName and collectionName and csv_file_path:
-        mongodb = MongoDB(host=host, port=port)
+        mongodb = MongoDB(host=host, port=port, fast_insert=fast_insert_var.get())
         mongodb.create_connection(dbName, collectionName)
-        mongodb.InsertData(path=csv_file_path)
+        # Import on a background thread so the window stays responsive while batches are sent
+        threading.Thread(target=mongodb.InsertData, kwargs={'path': csv_file_path}, daemon=True).start()
     else:
         print("Please fill in all the required fields.")
 
@@ -79,6 +157,11 @@ csv_entry.pack()
 csv_button = tk.Button(window, text="Browse", command=select_csv_file)
 csv_button.pack()
 
+# Write Concern Option
+fast_insert_var = tk.BooleanVar(value=False)
+fast_insert_check = tk.Checkbutton(window, text="Fast insert (no ack, write errors are not reported)", variable=fast_insert_var)
+fast_insert_check.pack()
+
 # Import Button
 import_button = tk.Button(window, text="Import to MongoDB", command=import_to_mongodb)
 import_button.pack()